@@ -11,9 +11,9 @@ This dashboard connects to REAL data sources:
 
 Enhancements v4.0:
 - GANDI UNIVERSE interactive constellation view
-- Force-directed graph with Apache ECharts
+- Constellation graph with Apache ECharts
 - Deep Space Cyberpunk theme
-- Physics-based entity visualization
+- Precomputed radial entity layout
 - Real-time entity health monitoring
 - Plotly charts for visual metrics
 - Auto-refresh every 5 minutes
@@ -21,8 +21,17 @@ Enhancements v4.0:
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import base64
+import html
 import json
-from datetime import datetime, timedelta, timezone
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import combinations
+from zoneinfo import ZoneInfo
 from pathlib import Path
 import pandas as pd
 import plotly.express as px
@@ -30,6 +39,11 @@ import plotly.graph_objects as go
 from streamlit_autorefresh import st_autorefresh
 from streamlit_echarts import st_echarts
 
+try:
+    import orjson  # Optional: ~3-5x faster JSON parsing
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -49,6 +63,13 @@ refresh_count = st_autorefresh(interval=300000, limit=None, key="dashboard_autor
 if "dark_mode" not in st.session_state:
     st.session_state.dark_mode = True  # Default ON for cyberpunk
 
+# Chart theme for this rerun - resolved once from the dark mode toggle
+THEME = {
+    "font": "#E0E0E0" if st.session_state.dark_mode else "#333333",
+    "grid": "rgba(128,128,128,0.2)",
+    "bg": "rgba(0,0,0,0)",
+}
+
 # ARIA GOD MODE v6 - Entity Router Session State
 if "current_entity" not in st.session_state:
     st.session_state.current_entity = None  # Currently detected working entity
@@ -56,230 +77,26 @@ if "current_entity_path" not in st.session_state:
     st.session_state.current_entity_path = None  # Path for autonomous folder selection
 
 # =============================================================================
-# DEEP SPACE CYBERPUNK CSS - ALWAYS APPLIED
+# DEEP SPACE CYBERPUNK CSS (+ light overrides when dark mode is off)
 # =============================================================================
-st.markdown("""
-<style>
-    /* ========== DEEP SPACE BACKGROUND ========== */
-    .stApp {
-        background: linear-gradient(180deg, #050510 0%, #0a0a1a 50%, #1a0a2e 100%);
-        background-attachment: fixed;
-    }
-
-    /* Starfield effect overlay */
-    .stApp::before {
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        pointer-events: none;
-        background-image:
-            radial-gradient(2px 2px at 20px 30px, rgba(255,255,255,0.3), transparent),
-            radial-gradient(2px 2px at 40px 70px, rgba(255,255,255,0.2), transparent),
-            radial-gradient(1px 1px at 90px 40px, rgba(255,255,255,0.4), transparent),
-            radial-gradient(2px 2px at 160px 120px, rgba(0,212,255,0.3), transparent),
-            radial-gradient(1px 1px at 230px 180px, rgba(255,255,255,0.2), transparent),
-            radial-gradient(2px 2px at 300px 250px, rgba(0,255,148,0.2), transparent);
-        background-size: 350px 350px;
-        z-index: 0;
-    }
-
-    /* ========== SIDEBAR STYLING ========== */
-    section[data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #0a0a1a 0%, #1a0a2e 100%);
-        border-right: 1px solid #00D4FF33;
-    }
-
-    section[data-testid="stSidebar"] .stMarkdown {
-        color: #E0E0E0;
-    }
-
-    /* ========== MAIN CONTENT ========== */
-    .main .block-container {
-        background: transparent;
-        color: #E0E0E0;
-    }
-
-    /* ========== HEADERS ========== */
-    h1, h2, h3 {
-        color: #00D4FF !important;
-        text-shadow: 0 0 20px rgba(0, 212, 255, 0.5);
-    }
-
-    h1 {
-        font-size: 2.5rem !important;
-        letter-spacing: 2px;
-    }
-
-    /* ========== TABS STYLING ========== */
-    .stTabs [data-baseweb="tab-list"] {
-        background: rgba(5, 5, 16, 0.8);
-        border-radius: 10px;
-        padding: 0.5rem;
-        gap: 0.5rem;
-    }
-
-    .stTabs [data-baseweb="tab"] {
-        background: transparent;
-        border: 1px solid #00D4FF33;
-        border-radius: 8px;
-        color: #8892b0;
-        padding: 0.75rem 1.5rem;
-        transition: all 0.3s ease;
-    }
-
-    .stTabs [data-baseweb="tab"]:hover {
-        background: rgba(0, 212, 255, 0.1);
-        border-color: #00D4FF;
-        color: #00D4FF;
-    }
-
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, rgba(0, 212, 255, 0.2), rgba(0, 184, 255, 0.1)) !important;
-        border-color: #00D4FF !important;
-        color: #00D4FF !important;
-        box-shadow: 0 0 15px rgba(0, 212, 255, 0.3);
-    }
-
-    /* ========== METRICS (Stat Cards) ========== */
-    [data-testid="stMetric"] {
-        background: linear-gradient(135deg, rgba(0, 212, 255, 0.1), rgba(26, 10, 46, 0.8));
-        border: 1px solid #00D4FF33;
-        border-radius: 12px;
-        padding: 1rem;
-        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.3), inset 0 0 30px rgba(0, 212, 255, 0.05);
-    }
-
-    [data-testid="stMetricLabel"] {
-        color: #8892b0 !important;
-    }
-
-    [data-testid="stMetricValue"] {
-        color: #00D4FF !important;
-        text-shadow: 0 0 10px rgba(0, 212, 255, 0.5);
-    }
-
-    /* ========== BUTTONS ========== */
-    .stButton > button {
-        background: linear-gradient(135deg, #00D4FF22, #00D4FF11);
-        border: 1px solid #00D4FF55;
-        color: #00D4FF;
-        border-radius: 8px;
-        transition: all 0.3s ease;
-        font-weight: 500;
-    }
-
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #00D4FF44, #00D4FF22);
-        border-color: #00D4FF;
-        box-shadow: 0 0 20px rgba(0, 212, 255, 0.4);
-        transform: translateY(-2px);
-    }
-
-    .stButton > button:active {
-        transform: translateY(0);
-    }
-
-    /* Primary buttons */
-    .stButton > button[kind="primary"] {
-        background: linear-gradient(135deg, #00D4FF, #00B8FF);
-        color: #050510;
-        font-weight: bold;
-    }
-
-    /* ========== TEXT INPUTS ========== */
-    .stTextInput > div > div > input {
-        background: rgba(5, 5, 16, 0.8);
-        border: 1px solid #00D4FF33;
-        border-radius: 8px;
-        color: #E0E0E0;
-    }
-
-    .stTextInput > div > div > input:focus {
-        border-color: #00D4FF;
-        box-shadow: 0 0 15px rgba(0, 212, 255, 0.3);
-    }
-
-    /* ========== DATA FRAMES ========== */
-    .stDataFrame {
-        background: rgba(5, 5, 16, 0.8);
-        border: 1px solid #00D4FF33;
-        border-radius: 8px;
-    }
-
-    /* ========== EXPANDERS ========== */
-    .streamlit-expanderHeader {
-        background: rgba(0, 212, 255, 0.1);
-        border: 1px solid #00D4FF33;
-        border-radius: 8px;
-        color: #00D4FF;
-    }
-
-    /* ========== SUCCESS/WARNING/ERROR BOXES ========== */
-    .stSuccess {
-        background: linear-gradient(135deg, rgba(0, 255, 148, 0.2), rgba(0, 255, 148, 0.05));
-        border-left: 4px solid #00FF94;
-    }
-
-    .stWarning {
-        background: linear-gradient(135deg, rgba(255, 215, 0, 0.2), rgba(255, 215, 0, 0.05));
-        border-left: 4px solid #FFD700;
-    }
-
-    .stError {
-        background: linear-gradient(135deg, rgba(255, 0, 85, 0.2), rgba(255, 0, 85, 0.05));
-        border-left: 4px solid #FF0055;
-    }
+STATIC_DIR = Path(__file__).parent / "static"
 
-    /* ========== DIVIDERS ========== */
-    hr {
-        border: none;
-        height: 1px;
-        background: linear-gradient(90deg, transparent, #00D4FF33, #00D4FF66, #00D4FF33, transparent);
-        margin: 1.5rem 0;
-    }
+@st.cache_resource
+def _css(name="cyberpunk.css"):
+    """Read a stylesheet from static/ once per server process"""
+    return (STATIC_DIR / name).read_text(encoding="utf-8")
 
-    /* ========== SCROLLBAR ========== */
-    ::-webkit-scrollbar {
-        width: 8px;
-        height: 8px;
-    }
+@st.cache_resource
+def _sidebar_icon():
+    """Bundled sidebar icon as an inline data URI - no external request on page load"""
+    svg = (STATIC_DIR / "command.svg").read_bytes()
+    return f"data:image/svg+xml;base64,{base64.b64encode(svg).decode('ascii')}"
 
-    ::-webkit-scrollbar-track {
-        background: #050510;
-    }
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
 
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(180deg, #00D4FF, #00B8FF);
-        border-radius: 4px;
-    }
-
-    /* ========== ENTITY GLOW EFFECTS ========== */
-    .entity-card-afk { border-left-color: #00FF94 !important; box-shadow: 0 0 20px rgba(0, 255, 148, 0.2); }
-    .entity-card-gakp { border-left-color: #FF0055 !important; box-shadow: 0 0 20px rgba(255, 0, 85, 0.2); }
-    .entity-card-gifp { border-left-color: #FFD700 !important; box-shadow: 0 0 20px rgba(255, 215, 0, 0.2); }
-    .entity-card-comf { border-left-color: #00B8FF !important; box-shadow: 0 0 20px rgba(0, 184, 255, 0.2); }
-    .entity-card-gakc { border-left-color: #9D00FF !important; box-shadow: 0 0 20px rgba(157, 0, 255, 0.2); }
-    .entity-card-prsl { border-left-color: #FF6B35 !important; box-shadow: 0 0 20px rgba(255, 107, 53, 0.2); }
-
-    /* ========== CAPTION/SMALL TEXT ========== */
-    .stCaption, small, .stMarkdown p {
-        color: #8892b0 !important;
-    }
-
-    /* ========== LINKS ========== */
-    a {
-        color: #00D4FF !important;
-        text-decoration: none;
-    }
-
-    a:hover {
-        text-shadow: 0 0 10px rgba(0, 212, 255, 0.5);
-    }
-</style>
-""", unsafe_allow_html=True)
+# Light mode only layers overrides on top - the dark (default) path emits nothing extra
+if not st.session_state.dark_mode:
+    st.markdown(f"<style>{_css('cyberpunk-light.css')}</style>", unsafe_allow_html=True)
 
 # Your n8n webhook base URL (Serveo tunnel)
 N8N_BASE_URL = "https://2327d83f0c3480b2-68-47-9-228.serveousercontent.com"
@@ -317,6 +134,63 @@ ENTITIES = {
     "FMLY": {"name": "Family", "color": "#FF69B4", "icon": "👨‍👩‍👧", "glow": "#FF69B455", "location": "USA"},
 }
 
+# Shared inter-entity link styles (one dict per color, reused by every link)
+_KENYA_STYLE = {"color": "#00FF9433", "width": 1, "curveness": 0.2}
+_USA_STYLE = {"color": "#FF005533", "width": 1, "curveness": 0.2}
+
+# Alert / email icon lookups (default: 🟡 for alerts, 📧 for emails)
+_SEVERITY_ICON = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+_PRIORITY_ICON = {"high": "🔴"}
+
+# Shared node label styles
+_LABEL_WHITE = {"show": True, "color": "#FFFFFF", "fontSize": 12}
+_LABEL_CORE = {"show": True, "color": "#FFFFFF", "fontSize": 14, "fontWeight": "bold"}
+# Static Universe layout: GANDI CORE at the center, entities on a ring grouped by category
+_UNIVERSE_CENTER = (400, 300)
+_UNIVERSE_RADIUS = 220
+
+@st.cache_resource
+def _entity_lookups():
+    """Lookups derived from ENTITIES - built once per server process, shared read-only"""
+    kenya_nodes = [f"{v['icon']} {k}" for k, v in ENTITIES.items() if v.get("location") == "Kenya"]
+    usa_nodes = [f"{v['icon']} {k}" for k, v in ENTITIES.items() if v.get("location") == "USA" and not v.get("hipaa")]
+    # Category index: 1 = Kenya, 2 = USA, 3 = Healthcare
+    category = {k: (3 if v.get("hipaa") else 1 if v.get("location") == "Kenya" else 2) for k, v in ENTITIES.items()}
+    return {
+        # st.cache_data keys on function source + arguments only, not on globals, so the
+        # chart builders also take the config they read (everything else derives from it)
+        "config_version": _json_dumps_sorted([
+            ENTITIES, UNIVERSE_THEME, _LABEL_CORE, _LABEL_WHITE, _KENYA_STYLE, _USA_STYLE,
+            _UNIVERSE_CENTER, _UNIVERSE_RADIUS,
+        ]),
+        "category": category,
+        # Entities on a ring around GANDI CORE, grouped by category
+        "positions": {
+            code: (
+                round(_UNIVERSE_CENTER[0] + _UNIVERSE_RADIUS * math.cos(2 * math.pi * i / len(ENTITIES)), 1),
+                round(_UNIVERSE_CENTER[1] + _UNIVERSE_RADIUS * math.sin(2 * math.pi * i / len(ENTITIES)), 1),
+            )
+            for i, code in enumerate(sorted(ENTITIES, key=category.get))
+        },
+        # Inter-entity links (Kenya <-> Kenya, USA <-> USA excluding HIPAA)
+        "edges": [
+            *({"source": a, "target": b, "lineStyle": _KENYA_STYLE} for a, b in combinations(kenya_nodes, 2)),
+            *({"source": a, "target": b, "lineStyle": _USA_STYLE} for a, b in combinations(usa_nodes, 2)),
+        ],
+        # Entity button labels and Business Status card row (Overview tab)
+        "orbit_labels": {code: f"{info['icon']} {code}" for code, info in ENTITIES.items()},
+        "card_html": '<div style="display: flex; flex-wrap: wrap; gap: 1rem; margin-bottom: 1rem;">' + "".join(
+            f"""<div style="flex: 1 1 140px;
+        background: linear-gradient(135deg, {info['color']}22, {info['color']}11);
+        border-left: 4px solid {info['color']}; padding: 1rem; border-radius: 8px;">
+        <h3 style="margin: 0; color: {info['color']};">{info['icon']} {code}</h3>
+        <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; opacity: 0.8;">{info['name']}</p>
+        <p style="margin: 0.5rem 0 0 0; font-size: 0.8rem;">Status: <strong>Active</strong></p>
+    </div>"""
+            for code, info in ENTITIES.items()
+        ) + "</div>",
+    }
+
 # =============================================================================
 # ARIA GOD MODE v6 FINAL - ENTITY ROUTER (Autonomous Folder Selection)
 # =============================================================================
@@ -365,43 +239,136 @@ ENTITY_ROUTER = {
     },
 }
 
+# =============================================================================
+# STATIC TAB DATA (AFK team, Admin status lists)
+# =============================================================================
+
+_AFK_TEAM = {
+    "Name": ["Richard", "Abdirahman", "Mohamed", "Suleiman"],
+    "Role": ["General Manager", "Finance", "Security", "Agronomist"],
+    "Contact": ["WhatsApp", "WhatsApp", "WhatsApp", "WhatsApp"],
+    "Status": ["Active", "Active", "Active", "Active"]
+}
+
+_MCP_SERVERS = [
+    ("Claude-Flow", "✅"),
+    ("Google Workspace", "✅"),
+    ("Gemini", "✅"),
+    ("GitHub", "✅"),
+    ("Memory", "✅"),
+]
+
+_LOCAL_SERVICES = [
+    ("Ollama", "✅ Running"),
+    ("n8n", "✅ Active"),
+    ("Serveo Tunnel", "✅ Connected"),
+]
+
+# Admin status columns as single markdown blocks (header + one line per row)
+_MCP_SERVERS_MD = "  \n".join(["**MCP Servers**"] + [f"{status} {name}" for name, status in _MCP_SERVERS])
+_LOCAL_SERVICES_MD = "  \n".join(["**Local Services**"] + [f"{status} - {name}" for name, status in _LOCAL_SERVICES])
+
+@st.cache_resource
+def _afk_team_df():
+    """AFK team table - built once per server process, shared read-only"""
+    return pd.DataFrame(_AFK_TEAM)
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+def _json_loads(raw):
+    """Parse JSON bytes/str - orjson when available, stdlib json otherwise"""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _json_dumps_sorted(obj):
+    """Canonical (sorted-key) JSON bytes - used as a hashable cache key"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True).encode("utf-8")
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _local_time(epoch_minute: int, tz_name: str):
+    """Wall-clock time in tz_name for a given minute - cached per minute across reruns"""
+    return datetime.fromtimestamp(epoch_minute * 60, ZoneInfo(tz_name))
+
+def _cst_now():
+    """Current Minneapolis time (America/Chicago - CST/CDT, DST-aware)"""
+    return _local_time(int(time.time()) // 60, "America/Chicago")
+
 def get_kenya_time():
     """Get current time in Kenya (EAT = UTC+3)"""
-    utc_now = datetime.now(timezone.utc)
-    kenya_time = utc_now + timedelta(hours=3)
-    return kenya_time.strftime("%I:%M %p")
+    return _local_time(int(time.time()) // 60, "Africa/Nairobi").strftime("%I:%M %p")
 
 def get_cst_time():
-    """Get current time in Minneapolis (CST = UTC-6)"""
-    utc_now = datetime.now(timezone.utc)
-    cst_time = utc_now - timedelta(hours=6)
-    return cst_time.strftime("%I:%M %p")
+    """Get current time in Minneapolis (America/Chicago, CST/CDT)"""
+    return _cst_now().strftime("%I:%M %p")
 
-def is_kenya_window():
-    """Check if we're in Kenya Window (6-9 AM CST = 3-6 PM Kenya)"""
-    utc_now = datetime.now(timezone.utc)
-    cst_hour = (utc_now - timedelta(hours=6)).hour
-    return 6 <= cst_hour < 9
+def get_cst_zone():
+    """Current Minneapolis zone abbreviation - CST in winter, CDT in summer"""
+    return _cst_now().strftime("%Z")
 
-def fetch_n8n_webhook(endpoint, data=None):
-    """Send command to n8n webhook"""
+def is_kenya_window():
+    """Check if we're in Kenya Window (6-9 AM Minneapolis = afternoon in Kenya)"""
+    return 6 <= _cst_now().hour < 9
+
+@st.cache_data(ttl=1, show_spinner=False)
+def _footer_times():
+    """Footer date + Minneapolis/Kenya times - refreshed at most once per second"""
+    return datetime.now().strftime('%B %d, %Y'), get_cst_time(), get_cst_zone(), get_kenya_time()
+
+@st.cache_resource
+def _n8n_session():
+    """Shared HTTP session - keeps the Serveo TLS connection alive across reruns"""
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json", "User-Agent": "GANDI-Command-Center"})
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=1, backoff_factor=0.3))
+    session.mount("https://", adapter)
+    return session
+
+def _request_webhook(endpoint):
+    """GET an n8n webhook - raises on non-200, so every GET path fails the same way"""
+    response = _n8n_session().get(f"{N8N_BASE_URL}/webhook/{endpoint}", timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_webhook(endpoint, minute):
+    """Cached GET for status polling - identical polls within the same minute hit the cache.
+    Failures raise, so they are never cached."""
+    return _request_webhook(endpoint)
+
+@st.cache_resource
+def _webhook_pool():
+    """Background workers for webhook POSTs - the UI never waits on n8n"""
+    return ThreadPoolExecutor(max_workers=4)
+
+def _post_webhook(session, endpoint, data):
+    """POST to an n8n webhook - runs on a worker thread, never raises"""
     try:
-        url = f"{N8N_BASE_URL}/webhook/{endpoint}"
-        if data:
-            response = requests.post(url, json=data, timeout=10)
-        else:
-            response = requests.get(url, timeout=10)
+        response = session.post(f"{N8N_BASE_URL}/webhook/{endpoint}", json=data, timeout=10)
         return response.json() if response.status_code == 200 else None
     except Exception as e:
         return {"error": str(e)}
 
+def fetch_n8n_webhook(endpoint, data=None, cached=False):
+    """Send command to n8n webhook (POSTs are never cached; GETs only opt in with cached=True)"""
+    if data:
+        return _post_webhook(_n8n_session(), endpoint, data)
+    try:
+        if cached:
+            return _get_webhook(endpoint, int(time.time()) // 60)
+        return _request_webhook(endpoint)
+    except Exception as e:
+        return {"error": str(e)}
+
+def submit_n8n_webhook(endpoint, data):
+    """Queue a webhook POST on the background pool - returns a Future"""
+    return _webhook_pool().submit(_post_webhook, _n8n_session(), endpoint, data)
+
 def send_voice_command(command_text):
-    """Send voice command to n8n for processing"""
-    return fetch_n8n_webhook("claude-commander", {"command": command_text, "source": "streamlit"})
+    """Queue voice command to n8n for processing - returns a Future"""
+    return submit_n8n_webhook("claude-commander", {"command": command_text, "source": "streamlit"})
 
 # =============================================================================
 # ARIA GOD MODE v6 - ENTITY DETECTION (Autonomous Folder Selection)
@@ -460,29 +427,70 @@ def get_ai_route_for_entity(entity_info):
         "warning": False
     }
 
-def load_live_data():
-    """Load live data from JSON file (updated by Claude/MCP)"""
-    data_file = Path(__file__).parent / "data" / "live_data.json"
+LIVE_DATA_FILE = Path(__file__).parent / "data" / "live_data.json"
+
+def live_data_mtime():
+    """Modification time of the live data file (0.0 if missing) - used as cache key"""
+    return LIVE_DATA_FILE.stat().st_mtime if LIVE_DATA_FILE.exists() else 0.0
+
+@st.cache_data(ttl=300, max_entries=4, show_spinner=False)
+def load_live_data(mtime: float):
+    """
+    Load live data from JSON file (updated by Claude/MCP)
+    Cached per file mtime, so a new write by Claude/MCP invalidates automatically
+    """
+    data_file = LIVE_DATA_FILE
     try:
         if data_file.exists():
-            with open(data_file, 'r') as f:
-                return json.load(f)
+            return _json_loads(data_file.read_bytes())
     except Exception as e:
         st.error(f"Error loading live data: {e}")
     return None
 
 
+@st.cache_data(max_entries=4, show_spinner=False)
+def prepare_priority_emails(mtime: float, _email_summary: dict):
+    """
+    Top 5 priority emails pre-shaped for display (icon, truncated subject)
+    Cached per live data file mtime - the summary itself is not hashed
+    """
+    emails = []
+    for email in _email_summary.get("priority_emails", [])[:5]:
+        subject = email.get("subject", "No subject")
+        emails.append({
+            "icon": _PRIORITY_ICON.get(email.get("priority", ""), "📧"),
+            "subject_short": f"{subject[:50]}{'...' if len(subject) > 50 else ''}",
+            "from": email.get("from", "Unknown"),
+            "entity": email.get("entity", "--"),
+        })
+    return emails
+
+
 def render_universe(live_data=None):
     """
     Render the GANDI UNIVERSE interactive constellation view
-    Force-directed graph with physics simulation using Apache ECharts
+    Constellation graph with a precomputed radial layout using Apache ECharts
     """
     # Get entity health scores from live data
     entity_data = live_data.get("entities", {}) if live_data else {}
+    return _build_universe_option(_json_dumps_sorted(entity_data), _entity_lookups()["config_version"])
+
+
+@st.cache_data(show_spinner=False)
+def _build_universe_option(entities_json: bytes, config_version: bytes) -> dict:
+    """Build the Universe ECharts option - cached on the canonical entities JSON"""
+    entity_data = _json_loads(entities_json)
+
+    # Theme colors bound once as locals
+    core_glow = UNIVERSE_THEME["core_glow"]
+    void_black = UNIVERSE_THEME["void_black"]
+    text_primary = UNIVERSE_THEME["text_primary"]
+    text_secondary = UNIVERSE_THEME["text_secondary"]
+    lookups = _entity_lookups()
 
     # Categories for node coloring
     categories = [
-        {"name": "Core", "itemStyle": {"color": UNIVERSE_THEME["core_glow"]}},
+        {"name": "Core", "itemStyle": {"color": core_glow}},
         {"name": "Kenya", "itemStyle": {"color": "#00FF94"}},
         {"name": "USA", "itemStyle": {"color": "#FF0055"}},
         {"name": "Healthcare", "itemStyle": {"color": "#00B8FF"}},
@@ -495,117 +503,86 @@ def render_universe(live_data=None):
             "symbolSize": 100,
             "value": "Command Center",
             "category": 0,
-            "fixed": True,
-            "x": 400,
-            "y": 300,
+            "x": _UNIVERSE_CENTER[0],
+            "y": _UNIVERSE_CENTER[1],
             "itemStyle": {
-                "color": UNIVERSE_THEME["core_glow"],
+                "color": core_glow,
                 "shadowBlur": 30,
-                "shadowColor": UNIVERSE_THEME["core_glow"],
+                "shadowColor": core_glow,
             },
-            "label": {
-                "show": True,
-                "color": "#FFFFFF",
-                "fontSize": 14,
-                "fontWeight": "bold",
-            }
+            "label": _LABEL_CORE,
         }
     ]
 
-    # Add entity nodes
-    for code, info in ENTITIES.items():
-        health = entity_data.get(code, {}).get("health_score", 80)
-        pending = entity_data.get(code, {}).get("pending_items", 0)
-        status = entity_data.get(code, {}).get("status", "Active")
-
-        # Determine category based on location
-        if info.get("hipaa"):
-            cat = 3  # Healthcare
-        elif info.get("location") == "Kenya":
-            cat = 1  # Kenya
-        else:
-            cat = 2  # USA
+    # Single pass over ENTITIES: one node + one GANDI CORE link per entity
+    nodes += [None] * len(ENTITIES)
+    links = [None] * len(ENTITIES)
+    for i, (code, info) in enumerate(ENTITIES.items()):
+        color = info["color"]
+        stats = entity_data.get(code, {})
+        health = stats.get("health_score", 80)
+        pending = stats.get("pending_items", 0)
 
         # Size based on health score (30-70 range)
         size = 30 + (health / 100) * 40
 
-        nodes.append({
-            "name": f"{info['icon']} {code}",
+        x, y = lookups["positions"][code]
+        node_name = f"{info['icon']} {code}"
+
+        nodes[i + 1] = {
+            "name": node_name,
             "symbolSize": size,
             "value": f"{info['name']}\nHealth: {health}%\nPending: {pending}",
-            "category": cat,
+            "category": lookups["category"][code],
+            "x": x,
+            "y": y,
             "itemStyle": {
-                "color": info["color"],
+                "color": color,
                 "shadowBlur": 20,
                 "shadowColor": info["glow"],
             },
-            "label": {
-                "show": True,
-                "color": "#FFFFFF",
-                "fontSize": 12,
-            }
-        })
+            "label": _LABEL_WHITE,
+        }
 
-    # Build links (all entities connect to GANDI CORE)
-    links = []
-    for code, info in ENTITIES.items():
-        links.append({
+        # All entities connect to GANDI CORE
+        links[i] = {
             "source": "GANDI\nCORE",
-            "target": f"{info['icon']} {code}",
+            "target": node_name,
             "lineStyle": {
-                "color": info["color"],
+                "color": color,
                 "width": 2,
                 "curveness": 0.1,
                 "opacity": 0.6,
             }
-        })
-
-    # Add inter-entity connections (Kenya <-> Kenya, USA <-> USA)
-    kenya_entities = [f"{info['icon']} {code}" for code, info in ENTITIES.items() if info.get("location") == "Kenya"]
-    usa_entities = [f"{info['icon']} {code}" for code, info in ENTITIES.items() if info.get("location") == "USA" and not info.get("hipaa")]
-
-    # Connect Kenya entities
-    for i, e1 in enumerate(kenya_entities):
-        for e2 in kenya_entities[i+1:]:
-            links.append({
-                "source": e1,
-                "target": e2,
-                "lineStyle": {"color": "#00FF9433", "width": 1, "curveness": 0.2}
-            })
+        }
 
-    # Connect USA entities (excluding HIPAA)
-    for i, e1 in enumerate(usa_entities):
-        for e2 in usa_entities[i+1:]:
-            links.append({
-                "source": e1,
-                "target": e2,
-                "lineStyle": {"color": "#FF005533", "width": 1, "curveness": 0.2}
-            })
+    # Add inter-entity connections (precomputed)
+    links.extend(lookups["edges"])
 
     # ECharts configuration
     option = {
-        "backgroundColor": UNIVERSE_THEME["void_black"],
+        "backgroundColor": void_black,
         "title": {
             "text": "G A N D I   U N I V E R S E",
             "subtext": "Interactive Entity Constellation",
             "top": "5%",
             "left": "center",
             "textStyle": {
-                "color": UNIVERSE_THEME["core_glow"],
+                "color": core_glow,
                 "fontSize": 24,
                 "fontWeight": "bold",
-                "textShadowColor": UNIVERSE_THEME["core_glow"],
+                "textShadowColor": core_glow,
                 "textShadowBlur": 10,
             },
             "subtextStyle": {
-                "color": UNIVERSE_THEME["text_secondary"],
+                "color": text_secondary,
                 "fontSize": 12,
             }
         },
         "tooltip": {
             "trigger": "item",
             "backgroundColor": "rgba(5, 5, 16, 0.9)",
-            "borderColor": UNIVERSE_THEME["core_glow"],
+            "borderColor": core_glow,
             "textStyle": {"color": "#FFFFFF"},
             "formatter": "{b}<br/>{c}"
         },
@@ -614,7 +591,7 @@ def render_universe(live_data=None):
             "orient": "vertical",
             "left": "5%",
             "top": "center",
-            "textStyle": {"color": UNIVERSE_THEME["text_primary"]},
+            "textStyle": {"color": text_primary},
             "itemGap": 20,
         },
         "animationDuration": 1500,
@@ -623,7 +600,7 @@ def render_universe(live_data=None):
             {
                 "name": "GANDI Universe",
                 "type": "graph",
-                "layout": "force",
+                "layout": "none",  # Positions precomputed - no force simulation ticks
                 "data": nodes,
                 "links": links,
                 "categories": categories,
@@ -634,13 +611,6 @@ def render_universe(live_data=None):
                     "position": "bottom",
                     "distance": 5,
                 },
-                "force": {
-                    "repulsion": 800,
-                    "edgeLength": [100, 250],
-                    "gravity": 0.1,
-                    "friction": 0.6,
-                    "layoutAnimation": True,
-                },
                 "emphasis": {
                     "focus": "adjacency",
                     "lineStyle": {"width": 4},
@@ -665,8 +635,17 @@ def render_entity_orbit(entity_code, live_data=None):
     if entity_code not in ENTITIES:
         return None
 
-    info = ENTITIES[entity_code]
     entity_data = live_data.get("entities", {}).get(entity_code, {}) if live_data else {}
+    return _build_entity_orbit_option(entity_code, _json_dumps_sorted(entity_data), _entity_lookups()["config_version"])
+
+
+@st.cache_data(show_spinner=False)
+def _build_entity_orbit_option(entity_code: str, entity_json: bytes, config_version: bytes) -> dict:
+    """Build the orbit ECharts option for one entity - cached on code + entity JSON"""
+    info = ENTITIES[entity_code]
+    color = info["color"]
+    center_name = f"{info['icon']} {entity_code}"
+    entity_data = _json_loads(entity_json)
 
     health = entity_data.get("health_score", 80)
     pending = entity_data.get("pending_items", 0)
@@ -677,14 +656,14 @@ def render_entity_orbit(entity_code, live_data=None):
     nodes = [
         # Central entity
         {
-            "name": f"{info['icon']} {entity_code}",
+            "name": center_name,
             "symbolSize": 80,
             "value": f"{info['name']}\nStatus: {status}",
             "fixed": True,
             "x": 300,
             "y": 200,
-            "itemStyle": {"color": info["color"], "shadowBlur": 30, "shadowColor": info["glow"]},
-            "label": {"show": True, "color": "#FFFFFF", "fontSize": 14, "fontWeight": "bold"},
+            "itemStyle": {"color": color, "shadowBlur": 30, "shadowColor": info["glow"]},
+            "label": _LABEL_CORE,
         },
         # Orbital nodes
         {"name": f"Health\n{health}%", "symbolSize": 40, "itemStyle": {"color": "#00FF94" if health >= 80 else "#FFD700" if health >= 60 else "#FF0055"}},
@@ -693,9 +672,9 @@ def render_entity_orbit(entity_code, live_data=None):
     ]
 
     links = [
-        {"source": f"{info['icon']} {entity_code}", "target": f"Health\n{health}%"},
-        {"source": f"{info['icon']} {entity_code}", "target": f"Pending\n{pending}"},
-        {"source": f"{info['icon']} {entity_code}", "target": f"Status\n{status}"},
+        {"source": center_name, "target": f"Health\n{health}%"},
+        {"source": center_name, "target": f"Pending\n{pending}"},
+        {"source": center_name, "target": f"Status\n{status}"},
     ]
 
     option = {
@@ -703,9 +682,9 @@ def render_entity_orbit(entity_code, live_data=None):
         "title": {
             "text": f"{info['icon']} {info['name']} Orbit",
             "left": "center",
-            "textStyle": {"color": info["color"], "fontSize": 18},
+            "textStyle": {"color": color, "fontSize": 18},
         },
-        "tooltip": {"trigger": "item", "backgroundColor": "rgba(5,5,16,0.9)", "borderColor": info["color"]},
+        "tooltip": {"trigger": "item", "backgroundColor": "rgba(5,5,16,0.9)", "borderColor": color},
         "series": [{
             "type": "graph",
             "layout": "force",
@@ -713,18 +692,93 @@ def render_entity_orbit(entity_code, live_data=None):
             "links": links,
             "roam": True,
             "force": {"repulsion": 300, "edgeLength": 100, "gravity": 0.2},
-            "lineStyle": {"color": info["color"], "opacity": 0.6, "width": 2},
+            "lineStyle": {"color": color, "opacity": 0.6, "width": 2},
         }]
     }
 
     return option
 
+def metrics_html(metrics):
+    """
+    Render a row of static metrics as one HTML flex grid (one delta instead of one per metric)
+    metrics: list of (label, value, delta, help) tuples - delta/help may be None
+    """
+    cards = []
+    for label, value, delta, help_text in metrics:
+        title = f' title="{html.escape(help_text)}"' if help_text else ""
+        delta_html = f'<div class="metric-delta">{html.escape(str(delta))}</div>' if delta else ""
+        cards.append(
+            f'<div class="metric-card"{title}>'
+            f'<div class="metric-label">{html.escape(label)}</div>'
+            f'<div class="metric-value">{html.escape(str(value))}</div>'
+            f'{delta_html}</div>'
+        )
+    return f'<div class="metric-grid">{"".join(cards)}</div>'
+
+
+@st.cache_data(show_spinner=False)
+def build_activity_pie(values, names, colors, theme):
+    """Business activity pie chart - rebuilt only when inputs or theme change"""
+    fig = px.pie(
+        {"Entity": list(names), "Activity": list(values)},
+        values="Activity",
+        names="Entity",
+        title="Business Activity Distribution",
+        color_discrete_sequence=list(colors)
+    )
+    fig.update_layout(
+        height=300,
+        paper_bgcolor=theme["bg"],
+        plot_bgcolor=theme["bg"],
+        font=dict(color=theme["font"])
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def build_metrics_bar(categories, counts, theme):
+    """Today's metrics bar chart - rebuilt only when inputs or theme change"""
+    fig = go.Figure(data=[
+        go.Bar(
+            x=list(categories),
+            y=list(counts),
+            marker_color=["#3b82f6", "#22c55e", "#f59e0b", "#ef4444"]
+        )
+    ])
+    fig.update_layout(
+        title="Today's Metrics",
+        height=300,
+        paper_bgcolor=theme["bg"],
+        plot_bgcolor=theme["bg"],
+        font=dict(color=theme["font"]),
+        yaxis=dict(gridcolor=theme["grid"])
+    )
+    return fig
+
+def _dispatch_command(command_data, target):
+    """Send Command callback - queues the POST in the background, one command in flight at a time"""
+    if "pending_cmd" not in st.session_state:
+        st.session_state.pending_cmd = (submit_n8n_webhook("claude-commander", command_data), target)
+
+@st.fragment(run_every="1s")
+def _render_pending_command():
+    """Sidebar status for the background send - reruns the whole app once the Future resolves"""
+    future, target = st.session_state.pending_cmd
+    if not future.done():
+        st.caption(f"⏳ Sending command to {target}...")
+        return
+    del st.session_state.pending_cmd
+    result = future.result()
+    st.session_state.cmd_result = (bool(result) and "error" not in result, target)
+    st.rerun()
+
+
 # =============================================================================
 # SIDEBAR - Navigation & Quick Actions
 # =============================================================================
 
 with st.sidebar:
-    st.image("https://img.icons8.com/fluency/96/command-line.png", width=80)
+    st.markdown(f'<img src="{_sidebar_icon()}" width="80" alt="GANDI Command Center"/>', unsafe_allow_html=True)
     st.title("GANDI Command Center")
 
     # ARIA GOD MODE v6 - Current Working Entity Indicator
@@ -745,12 +799,10 @@ with st.sidebar:
         </div>
         """, unsafe_allow_html=True)
 
-    # Dark Mode Toggle
+    # Dark Mode Toggle (bound to session state - no forced st.rerun())
     col_mode1, col_mode2 = st.columns([1, 1])
     with col_mode1:
-        if st.button("☀️ Light" if st.session_state.dark_mode else "🌙 Dark", use_container_width=True):
-            st.session_state.dark_mode = not st.session_state.dark_mode
-            st.rerun()
+        st.toggle("🌙 Dark", key="dark_mode")
     with col_mode2:
         st.caption(f"Auto: {refresh_count}")
 
@@ -758,7 +810,7 @@ with st.sidebar:
     st.markdown("---")
     col1, col2 = st.columns(2)
     with col1:
-        st.metric("Minneapolis", get_cst_time(), "CST")
+        st.metric("Minneapolis", get_cst_time(), get_cst_zone())
     with col2:
         st.metric("Kenya", get_kenya_time(), "EAT")
 
@@ -821,25 +873,40 @@ with st.sidebar:
             else:
                 st.caption(f"🤖 Route: {ai_route['primary'].upper()}")
 
-        if st.button("Send Command", type="primary"):
-            # Include entity context in the command
-            command_data = {
-                "command": voice_input,
-                "source": "streamlit",
-                "detected_entity": detected["code"] if detected else None,
-                "entity_path": detected["path"] if detected else None,
-                "hipaa_mode": detected["hipaa"] if detected else False
-            }
-            result = fetch_n8n_webhook("claude-commander", command_data)
-            if result and "error" not in result:
-                st.success(f"Command sent to {detected['code'] if detected else 'HUB'}!")
-            else:
-                st.error("Could not send command")
+        # Include entity context in the command
+        command_data = {
+            "command": voice_input,
+            "source": "streamlit",
+            "detected_entity": detected["code"] if detected else None,
+            "entity_path": detected["path"] if detected else None,
+            "hipaa_mode": detected["hipaa"] if detected else False
+        }
+        # Dispatched from on_click, so the button is already disabled in the rerun the click triggers
+        st.button(
+            "Send Command", type="primary",
+            disabled="pending_cmd" in st.session_state,
+            on_click=_dispatch_command,
+            args=(command_data, detected["code"] if detected else "HUB"),
+        )
+
+    # Poll the in-flight command every second, then show its result after the full rerun
+    if "pending_cmd" in st.session_state:
+        _render_pending_command()
+    elif "cmd_result" in st.session_state:
+        ok, target = st.session_state.pop("cmd_result")
+        if ok:
+            st.success(f"Command sent to {target}!")
+        else:
+            st.error("Could not send command")
 
 # =============================================================================
 # MAIN CONTENT - Tabbed Interface
 # =============================================================================
 
+# Load live data once per rerun - every tab (and the footer) renders the same snapshot
+st.session_state.live_data_mtime = live_data_mtime()
+st.session_state.live_data = load_live_data(st.session_state.live_data_mtime)
+
 # Create tabs for each business entity - NOW WITH UNIVERSE VIEW!
 tab_universe, tab_overview, tab_afk, tab_properties, tab_comf, tab_admin = st.tabs([
     "🌌 Universe",
@@ -853,119 +920,97 @@ tab_universe, tab_overview, tab_afk, tab_properties, tab_comf, tab_admin = st.ta
 # -----------------------------------------------------------------------------
 # TAB: UNIVERSE - Interactive Constellation View
 # -----------------------------------------------------------------------------
-with tab_universe:
-    st.markdown("""
-    <style>
-    .universe-container {
-        background: linear-gradient(180deg, #050510 0%, #1a0a2e 100%);
-        border-radius: 16px;
-        padding: 1rem;
-        margin: -1rem;
-    }
-    .universe-header {
-        text-align: center;
-        color: #00D4FF;
-        text-shadow: 0 0 20px #00D4FF;
-        font-size: 1.5rem;
-        margin-bottom: 1rem;
-    }
-    .universe-subtitle {
-        text-align: center;
-        color: #8892b0;
-        font-size: 0.9rem;
-        margin-bottom: 1rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-    # Load live data for Universe visualization
-    universe_data = load_live_data()
-
-    st.markdown('<div class="universe-container">', unsafe_allow_html=True)
-
-    # Render the interactive force-directed graph
-    universe_option = render_universe(universe_data)
-    st_echarts(options=universe_option, height="600px", key="universe_main")
-
-    st.markdown('</div>', unsafe_allow_html=True)
+@st.fragment
+def _render_entity_orbit_section():
+    """Orbit selector + deep dive - nested fragment, entity picks skip the Universe graph"""
+    universe_data = st.session_state.live_data
 
     # Entity orbit selector
     st.markdown("---")
     st.subheader("🔭 Deep Dive: Entity Orbit View")
 
-    orbit_cols = st.columns(6)
-    for i, (code, info) in enumerate(ENTITIES.items()):
-        with orbit_cols[i]:
-            if st.button(f"{info['icon']} {code}", key=f"orbit_{code}", use_container_width=True):
-                st.session_state.selected_entity = code
+    # One segmented control (bound to session state) instead of a button per entity
+    selected = st.segmented_control(
+        "Entity",
+        list(ENTITIES),
+        format_func=_entity_lookups()["orbit_labels"].get,
+        selection_mode="single",
+        key="selected_entity",
+        label_visibility="collapsed",
+    )
 
     # Show entity orbit if selected
-    if "selected_entity" in st.session_state and st.session_state.selected_entity:
-        selected = st.session_state.selected_entity
+    if selected:
         st.markdown(f"### {ENTITIES[selected]['icon']} {ENTITIES[selected]['name']} Orbit")
 
         orbit_option = render_entity_orbit(selected, universe_data)
         if orbit_option:
-            st_echarts(options=orbit_option, height="400px", key=f"orbit_{selected}_view")
+            st_echarts(options=orbit_option, height="400px", key="orbit_view")  # Stable key: update in place
 
         # Entity quick stats
         entity_info = universe_data.get("entities", {}).get(selected, {}) if universe_data else {}
-        stat_cols = st.columns(4)
-        with stat_cols[0]:
-            st.metric("Health Score", f"{entity_info.get('health_score', '--')}%")
-        with stat_cols[1]:
-            st.metric("Pending Items", entity_info.get('pending_items', '--'))
-        with stat_cols[2]:
-            st.metric("Status", entity_info.get('status', 'Unknown'))
-        with stat_cols[3]:
-            st.metric("Location", ENTITIES[selected].get('location', '--'))
+        st.markdown(metrics_html([
+            ("Health Score", f"{entity_info.get('health_score', '--')}%", None, None),
+            ("Pending Items", entity_info.get('pending_items', '--'), None, None),
+            ("Status", entity_info.get('status', 'Unknown'), None, None),
+            ("Location", ENTITIES[selected].get('location', '--'), None, None),
+        ]), unsafe_allow_html=True)
 
         st.caption(f"Recent Activity: {entity_info.get('recent_activity', 'No recent activity')}")
 
-# -----------------------------------------------------------------------------
-# TAB: OVERVIEW
-# -----------------------------------------------------------------------------
-with tab_overview:
-    st.header("🎯 Command Center Overview")
+@st.fragment
+def _render_universe_tab():
+    """Universe tab - fragment, so its widgets rerun only this tab"""
+    # Load live data for Universe visualization
+    universe_data = st.session_state.live_data
 
-    # Load live data
-    live_data = load_live_data()
+    st.markdown('<div class="universe-container">', unsafe_allow_html=True)
 
-    # Top metrics row
-    col1, col2, col3, col4, col5 = st.columns(5)
+    # Render the interactive constellation graph
+    universe_option = render_universe(universe_data)
+    st_echarts(options=universe_option, height="600px", key="universe_main")
 
-    with col1:
-        email_count = live_data.get("email_summary", {}).get("unread_count", "--") if live_data else "--"
-        email_delta = "unread" if live_data else "Loading..."
-        st.metric(
-            label="📧 Emails Today",
-            value=email_count,
-            delta=email_delta,
-            help="Fetched from Gmail"
-        )
+    st.markdown('</div>', unsafe_allow_html=True)
 
-    with col2:
-        event_count = live_data.get("calendar_summary", {}).get("events_today", "--") if live_data else "--"
-        event_delta = "scheduled" if live_data else "Loading..."
-        st.metric(
-            label="📅 Events Today",
-            value=event_count,
-            delta=event_delta,
-            help="From Google Calendar"
-        )
+    # Entity orbit deep dive (nested fragment)
+    _render_entity_orbit_section()
 
-    with col3:
-        task_count = live_data.get("system_health", {}).get("pending_tasks", 0) if live_data else "--"
-        task_delta = "pending" if live_data else "Loading..."
-        st.metric(
-            label="✅ Tasks Due",
-            value=task_count,
-            delta=task_delta,
-            help="From Command Center Sheet"
-        )
+with tab_universe:
+    _render_universe_tab()
+
+# -----------------------------------------------------------------------------
+# TAB: OVERVIEW
+# -----------------------------------------------------------------------------
+@st.fragment
+def _render_overview_tab():
+    """Overview tab - fragment, so its widgets rerun only this tab"""
+    st.header("🎯 Command Center Overview")
 
-    with col4:
-        alert_count = live_data.get("alerts", {}).get("count", 0) if live_data else 0
+    # Load live data
+    live_data = st.session_state.live_data
+
+    # Summary sections - looked up once, shared by the metrics, charts and lists below
+    email_sum = (live_data or {}).get("email_summary", {})
+    cal_sum = (live_data or {}).get("calendar_summary", {})
+    sys_health = (live_data or {}).get("system_health", {})
+    alerts = (live_data or {}).get("alerts", {})
+
+    # Top metrics row - static metrics batched into one HTML grid, Alerts keeps st.metric for delta_color
+    col_static, col_alerts = st.columns([4, 1])
+
+    with col_static:
+        email_count = email_sum.get("unread_count", "--")
+        event_count = cal_sum.get("events_today", "--")
+        task_count = sys_health.get("pending_tasks", 0) if live_data else "--"
+        st.markdown(metrics_html([
+            ("📧 Emails Today", email_count, "unread" if live_data else "Loading...", "Fetched from Gmail"),
+            ("📅 Events Today", event_count, "scheduled" if live_data else "Loading...", "From Google Calendar"),
+            ("✅ Tasks Due", task_count, "pending" if live_data else "Loading...", "From Command Center Sheet"),
+            ("🤖 AI Status", "Online", "All systems", "MCP servers status"),
+        ]), unsafe_allow_html=True)
+
+    with col_alerts:
+        alert_count = alerts.get("count", 0)
         alert_delta = "urgent" if live_data and alert_count > 0 else "none"
         st.metric(
             label="⚠️ Alerts",
@@ -975,35 +1020,13 @@ with tab_overview:
             help="Critical items"
         )
 
-    with col5:
-        st.metric(
-            label="🤖 AI Status",
-            value="Online",
-            delta="All systems",
-            help="MCP servers status"
-        )
-
     st.markdown("---")
 
     # Business Status Cards
     st.subheader("🏢 Business Status")
 
-    cols = st.columns(len(ENTITIES))  # Dynamic: 6 entities
-    for i, (code, info) in enumerate(ENTITIES.items()):
-        with cols[i]:
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, {info['color']}22, {info['color']}11);
-                border-left: 4px solid {info['color']};
-                padding: 1rem;
-                border-radius: 8px;
-                margin-bottom: 1rem;
-            ">
-                <h3 style="margin: 0; color: {info['color']};">{info['icon']} {code}</h3>
-                <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; opacity: 0.8;">{info['name']}</p>
-                <p style="margin: 0.5rem 0 0 0; font-size: 0.8rem;">Status: <strong>Active</strong></p>
-            </div>
-            """, unsafe_allow_html=True)
+    # One flex row in a single markdown call (instead of one column + markdown per entity)
+    st.markdown(_entity_lookups()["card_html"], unsafe_allow_html=True)
 
     st.markdown("---")
 
@@ -1019,18 +1042,11 @@ with tab_overview:
                 "Activity": [35, 25, 20, 15, 5],  # Placeholder - connect to real data
                 "Color": ["#22c55e", "#3b82f6", "#8b5cf6", "#ec4899", "#f59e0b"]
             }
-            fig_pie = px.pie(
-                entity_data,
-                values="Activity",
-                names="Entity",
-                title="Business Activity Distribution",
-                color_discrete_sequence=entity_data["Color"]
-            )
-            fig_pie.update_layout(
-                height=300,
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
-                font=dict(color="#E0E0E0" if st.session_state.dark_mode else "#333333")
+            fig_pie = build_activity_pie(
+                tuple(entity_data["Activity"]),
+                tuple(entity_data["Entity"]),
+                tuple(entity_data["Color"]),
+                THEME,
             )
             st.plotly_chart(fig_pie, use_container_width=True)
         else:
@@ -1042,26 +1058,16 @@ with tab_overview:
             metrics_data = {
                 "Category": ["Emails", "Events", "Tasks", "Alerts"],
                 "Count": [
-                    live_data.get("email_summary", {}).get("unread_count", 0),
-                    live_data.get("calendar_summary", {}).get("events_today", 0),
-                    live_data.get("system_health", {}).get("pending_tasks", 0),
-                    live_data.get("alerts", {}).get("count", 0)
+                    email_sum.get("unread_count", 0),
+                    cal_sum.get("events_today", 0),
+                    sys_health.get("pending_tasks", 0),
+                    alerts.get("count", 0)
                 ]
             }
-            fig_bar = go.Figure(data=[
-                go.Bar(
-                    x=metrics_data["Category"],
-                    y=metrics_data["Count"],
-                    marker_color=["#3b82f6", "#22c55e", "#f59e0b", "#ef4444"]
-                )
-            ])
-            fig_bar.update_layout(
-                title="Today's Metrics",
-                height=300,
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
-                font=dict(color="#E0E0E0" if st.session_state.dark_mode else "#333333"),
-                yaxis=dict(gridcolor="rgba(128,128,128,0.2)")
+            fig_bar = build_metrics_bar(
+                tuple(metrics_data["Category"]),
+                tuple(metrics_data["Count"]),
+                THEME,
             )
             st.plotly_chart(fig_bar, use_container_width=True)
         else:
@@ -1074,23 +1080,23 @@ with tab_overview:
 
     with col_left:
         st.subheader("🔔 Recent Emails")
-        email_items = live_data.get("email_summary", {}).get("priority_emails", []) if live_data else []
+        email_items = prepare_priority_emails(st.session_state.live_data_mtime, email_sum)
         if email_items:
-            for email in email_items[:5]:
-                priority_icon = "🔴" if email.get("priority") == "high" else "📧"
-                subject = email.get("subject", "No subject")
-                st.markdown(f"{priority_icon} **{subject[:50]}{'...' if len(subject) > 50 else ''}**")
-                st.caption(f"From: {email.get('from', 'Unknown')} | Entity: {email.get('entity', '--')}")
+            st.markdown("\n\n".join(
+                f"{email['icon']} **{email['subject_short']}**  \nFrom: {email['from']} | Entity: {email['entity']}"
+                for email in email_items
+            ))
         else:
             st.info("No recent emails")
 
     with col_right:
         st.subheader("⚠️ Action Required")
-        alert_items = live_data.get("alerts", {}).get("items", []) if live_data else []
+        alert_items = alerts.get("items", [])
         if alert_items:
-            for alert in alert_items:
-                severity_color = "🔴" if alert.get("severity") == "high" else "🟡"
-                st.error(f"{severity_color} **{alert.get('type', 'ALERT').upper()}**: {alert.get('message', 'Unknown')}")
+            st.error("\n\n".join(
+                f"{_SEVERITY_ICON.get(alert.get('severity', ''), '🟡')} **{alert.get('type', 'ALERT').upper()}**: {alert.get('message', 'Unknown')}"
+                for alert in alert_items
+            ))
         else:
             st.success("No urgent alerts")
 
@@ -1099,38 +1105,32 @@ with tab_overview:
         st.markdown("**Pending Setup:**")
         st.markdown("- 📋 Configure Make.com webhooks (9 pending)")
 
+with tab_overview:
+    _render_overview_tab()
+
 # -----------------------------------------------------------------------------
 # TAB: AFK FARM
 # -----------------------------------------------------------------------------
-with tab_afk:
+@st.fragment
+def _render_afk_tab():
+    """AFK Farm tab - fragment, so its widgets rerun only this tab"""
     st.header("🌾 Afro Farm Kenya (AFK)")
     st.caption("128 acres | Loitokitok | GLOBALG.A.P. Certified")
 
     # Farm metrics
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.metric("👥 Workers", "18+", help="Farm staff")
-    with col2:
-        st.metric("🌱 Active Crops", "3", "French beans, Onions, Passion fruit")
-    with col3:
-        st.metric("📋 Compliance", "Active", "GLOBALG.A.P.")
-    with col4:
-        st.metric("🌡️ Status", "Operational", help="Last update from Richard")
+    st.markdown(metrics_html([
+        ("👥 Workers", "18+", None, "Farm staff"),
+        ("🌱 Active Crops", "3", "French beans, Onions, Passion fruit", None),
+        ("📋 Compliance", "Active", "GLOBALG.A.P.", None),
+        ("🌡️ Status", "Operational", None, "Last update from Richard"),
+    ]), unsafe_allow_html=True)
 
     st.markdown("---")
 
     # Team contacts
     st.subheader("👥 Farm Team")
 
-    team_data = {
-        "Name": ["Richard", "Abdirahman", "Mohamed", "Suleiman"],
-        "Role": ["General Manager", "Finance", "Security", "Agronomist"],
-        "Contact": ["WhatsApp", "WhatsApp", "WhatsApp", "WhatsApp"],
-        "Status": ["Active", "Active", "Active", "Active"]
-    }
-
-    st.dataframe(pd.DataFrame(team_data), use_container_width=True, hide_index=True)
+    st.dataframe(_afk_team_df(), use_container_width=True, hide_index=True)
 
     # Quick actions for farm
     st.subheader("⚡ Farm Actions")
@@ -1149,10 +1149,15 @@ with tab_afk:
         if st.button("✅ Compliance Check", use_container_width=True):
             st.info("Running GLOBALG.A.P. compliance check...")
 
+with tab_afk:
+    _render_afk_tab()
+
 # -----------------------------------------------------------------------------
 # TAB: PROPERTIES
 # -----------------------------------------------------------------------------
-with tab_properties:
+@st.fragment
+def _render_properties_tab():
+    """Properties tab - fragment, so its widgets rerun only this tab"""
     st.header("🏢 Real Estate Portfolio")
 
     col1, col2 = st.columns(2)
@@ -1160,8 +1165,10 @@ with tab_properties:
     with col1:
         st.subheader("🏢 GAK Properties (GAKP)")
         st.caption("USA | Property Management")
-        st.metric("Properties", "--", "Loading...")
-        st.metric("Leases Active", "--", "Loading...")
+        st.markdown(metrics_html([
+            ("Properties", "--", "Loading...", None),
+            ("Leases Active", "--", "Loading...", None),
+        ]), unsafe_allow_html=True)
 
         if st.button("View GAKP Details", use_container_width=True):
             st.info("Loading GAKP data from Google Sheets...")
@@ -1169,8 +1176,10 @@ with tab_properties:
     with col2:
         st.subheader("🏠 GIF Properties (GIFP)")
         st.caption("USA | Property Management")
-        st.metric("Properties", "--", "Loading...")
-        st.metric("Leases Active", "--", "Loading...")
+        st.markdown(metrics_html([
+            ("Properties", "--", "Loading...", None),
+            ("Leases Active", "--", "Loading...", None),
+        ]), unsafe_allow_html=True)
 
         if st.button("View GIFP Details", use_container_width=True):
             st.info("Loading GIFP data from Google Sheets...")
@@ -1181,6 +1190,9 @@ with tab_properties:
     st.caption("Kenya | Property Holdings")
     st.info("Kenya property data will be loaded from Google Sheets")
 
+with tab_properties:
+    _render_properties_tab()
+
 # -----------------------------------------------------------------------------
 # TAB: HEALTHCARE (COMF)
 # -----------------------------------------------------------------------------
@@ -1190,15 +1202,12 @@ with tab_comf:
 
     st.warning("⚠️ **HIPAA NOTICE**: PHI data is processed locally via Ollama only")
 
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.metric("Staff Scheduled", "--", "Loading...")
-        st.metric("Services Today", "--", "Loading...")
-
-    with col2:
-        st.metric("Compliance Status", "Active", "HIPAA Compliant")
-        st.metric("Local Processing", "Ollama", "PHI Protected")
+    st.markdown(metrics_html([
+        ("Staff Scheduled", "--", "Loading...", None),
+        ("Services Today", "--", "Loading...", None),
+        ("Compliance Status", "Active", "HIPAA Compliant", None),
+        ("Local Processing", "Ollama", "PHI Protected", None),
+    ]), unsafe_allow_html=True)
 
     st.markdown("---")
     st.info("Healthcare data is processed locally for HIPAA compliance. Use Ollama for any PHI-related queries.")
@@ -1206,7 +1215,9 @@ with tab_comf:
 # -----------------------------------------------------------------------------
 # TAB: ADMIN
 # -----------------------------------------------------------------------------
-with tab_admin:
+@st.fragment
+def _render_admin_tab():
+    """Admin tab - fragment, so its widgets rerun only this tab"""
     st.header("⚙️ System Administration")
 
     # System Status
@@ -1215,26 +1226,10 @@ with tab_admin:
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        st.markdown("**MCP Servers**")
-        servers = [
-            ("Claude-Flow", "✅"),
-            ("Google Workspace", "✅"),
-            ("Gemini", "✅"),
-            ("GitHub", "✅"),
-            ("Memory", "✅"),
-        ]
-        for name, status in servers:
-            st.markdown(f"{status} {name}")
+        st.markdown(_MCP_SERVERS_MD)
 
     with col2:
-        st.markdown("**Local Services**")
-        services = [
-            ("Ollama", "✅ Running"),
-            ("n8n", "✅ Active"),
-            ("Serveo Tunnel", "✅ Connected"),
-        ]
-        for name, status in services:
-            st.markdown(f"{status} - {name}")
+        st.markdown(_LOCAL_SERVICES_MD)
 
     with col3:
         st.markdown("**Webhooks**")
@@ -1267,7 +1262,7 @@ with tab_admin:
     st.subheader("🔐 Security Alerts")
 
     # Load live data for security alerts
-    admin_live_data = load_live_data()
+    admin_live_data = st.session_state.live_data
     alert_items = admin_live_data.get("alerts", {}).get("items", []) if admin_live_data else []
     if alert_items:
         for alert in alert_items:
@@ -1282,6 +1277,9 @@ with tab_admin:
     else:
         st.success("No security alerts at this time")
 
+with tab_admin:
+    _render_admin_tab()
+
 # =============================================================================
 # FOOTER
 # =============================================================================
@@ -1289,15 +1287,16 @@ with tab_admin:
 st.markdown("---")
 
 # Get last updated time from live data
-footer_data = load_live_data()
+footer_data = st.session_state.live_data
 last_updated = footer_data.get("last_updated", "Never") if footer_data else "Never"
 
 col_footer1, col_footer2 = st.columns([3, 1])
 
 with col_footer1:
+    date_s, cst_s, cst_zone, eat_s = _footer_times()
     st.caption(f"""
-    🎯 GANDI Command Center v2.0 | Interactive Edition | {datetime.now().strftime('%B %d, %Y')}
-    | Minneapolis: {get_cst_time()} CST | Kenya: {get_kenya_time()} EAT
+    🎯 GANDI Command Center v2.0 | Interactive Edition | {date_s}
+    | Minneapolis: {cst_s} {cst_zone} | Kenya: {eat_s} EAT
     | Data Updated: {last_updated}
     """)
 